@@ -3,7 +3,7 @@ Bayesian belief tracker for opponent Pokemon.
 Tracks probability distributions over roles, moves, items, abilities, and tera types.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 import numpy as np
 from collections import defaultdict
 
@@ -76,6 +76,36 @@ class BeliefTracker:
         if observed_tera:
             belief.observe_tera(observed_tera)
     
+    def update_batch(self, species: str, *,
+                     moves: Optional[Iterable[str]] = None,
+                     item: Optional[str] = None,
+                     ability: Optional[str] = None,
+                     tera: Optional[str] = None):
+        """
+        Apply all current observations for one Pokemon with a single belief lookup.
+        
+        Equivalent to calling update() once per move plus once each for
+        item/ability/tera, in that order.
+        
+        Args:
+            species: Pokemon species name
+            moves: Moves revealed so far
+            item: Item that was revealed
+            ability: Ability that was revealed
+            tera: Tera type that was revealed
+        """
+        belief = self.get_or_create_belief(species)
+        
+        if moves:
+            for move in moves:
+                belief.observe_move(move)
+        if item:
+            belief.observe_item(item)
+        if ability:
+            belief.observe_ability(ability)
+        if tera:
+            belief.observe_tera(tera)
+    
     def get_belief_embedding(self, species: str, embedding_size: int = 10) -> np.ndarray:
         """
         Get fixed-size embedding vector for a Pokemon's beliefs.
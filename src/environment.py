@@ -306,26 +306,24 @@ class Gen9RLEnvironment(SinglesEnv, gymnasium.Env):
     
     def _update_beliefs_from_battle(self, battle: AbstractBattle):
         """Update belief tracker based on battle events."""
+        update_batch = self.belief_tracker.update_batch
         for pokemon in battle.opponent_team.values():
-            species = pokemon.species
-            
-            if pokemon.moves:
-                for move_id in pokemon.moves:
-                    self.belief_tracker.update(species, observed_move=move_id)
-            
-            if pokemon.item:
-                self.belief_tracker.update(species, observed_item=pokemon.item)
-            
-            if pokemon.ability:
-                self.belief_tracker.update(species, observed_ability=pokemon.ability)
-
             # Record revealed tera type once terastallization happens.
+            tera = None
             try:
                 if getattr(pokemon, "is_terastallized", False) and getattr(pokemon, "tera_type", None):
-                    self.belief_tracker.update(species, observed_tera=pokemon.tera_type.name.lower())
+                    tera = pokemon.tera_type.name.lower()
             except Exception:
                 pass
 
+            update_batch(
+                pokemon.species,
+                moves=pokemon.moves,
+                item=pokemon.item,
+                ability=pokemon.ability,
+                tera=tera,
+            )
+
 
     # ... (metrics methods) ...
 
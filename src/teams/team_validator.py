@@ -2,49 +2,137 @@
 Team Validator: Validates generated teams against Pokemon Showdown data.
 
 Extracts valid items, abilities, and moves from pokemon-showdown/data/*.ts
+
+Single teams go through validate_packed_team / validate_showdown_team.
+validate_packed_teams_bulk checks many packed teams at once, resolving each
+distinct item string only once for the whole batch.
 """
 
+import logging
+import os
+import pickle
 import re
 from pathlib import Path
 from functools import lru_cache
+from typing import Iterable
 
 # Path to pokemon-showdown data
 SHOWDOWN_DATA_PATH = Path(__file__).parent.parent.parent / "pokemon-showdown" / "data"
 
-DEBUG = False  # Enable verbose logging
+# Parsed items.ts, reused across processes while items.ts is unchanged
+VALID_ITEMS_CACHE_PATH = Path.home() / ".cache" / "showdownRL" / "valid_items.pickle"
+
+# Set this logger to DEBUG for verbose tracing
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns (avoid the re module's per-call cache lookup)
+_ITEM_ID_RE = re.compile(r'[^a-z0-9]')
+_ITEM_LINE_RE = re.compile(r'^.+\s*@\s*(.+)$')
+
+# Deletion table for every ASCII character that is not [a-z0-9]
+_NORMALIZE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not ('a' <= chr(c) <= 'z' or '0' <= chr(c) <= '9')
+))
+
+# Characters allowed in an items.ts key
+_ITEM_KEY_BYTES = b'abcdefghijklmnopqrstuvwxyz0123456789'
+
+
+# Populated by _load_valid_items() on first use
+_VALID_ITEMS_CACHE = None
+
+
+def get_valid_items() -> frozenset:
+    """Return all valid item IDs from pokemon-showdown/data/items.ts"""
+    if _VALID_ITEMS_CACHE is not None:
+        return _VALID_ITEMS_CACHE
+    return _load_valid_items()
 
 
 @lru_cache(maxsize=1)
-def get_valid_items() -> set:
+def _load_valid_items() -> frozenset:
     """Extract all valid item IDs from pokemon-showdown/data/items.ts"""
+    global _VALID_ITEMS_CACHE
     items_file = SHOWDOWN_DATA_PATH / "items.ts"
     
     if not items_file.exists():
         print(f"[TeamValidator] Warning: items.ts not found at {items_file}")
-        return set()
+        _VALID_ITEMS_CACHE = frozenset()
+        return _VALID_ITEMS_CACHE
     
-    content = items_file.read_text()
+    stat = items_file.stat()
+    cache_key = (str(items_file.resolve()), stat.st_size, stat.st_mtime_ns)
     
-    # Extract item IDs (keys in the Items object)
-    # Pattern: starts with tab, lowercase alphanumeric, ends with colon
-    pattern = r'^\t([a-z0-9]+):'
-    matches = re.findall(pattern, content, re.MULTILINE)
-    
-    valid_items = set(matches)
+    valid_items = _read_items_disk_cache(cache_key)
+    if valid_items is None:
+        content = items_file.read_bytes()
+        valid_items = frozenset(_scan_item_keys(content))
+        _write_items_disk_cache(cache_key, valid_items)
     print(f"[TeamValidator] Loaded {len(valid_items)} valid items from {items_file}")
     
+    _VALID_ITEMS_CACHE = valid_items
     return valid_items
 
 
+def _read_items_disk_cache(cache_key: tuple):
+    """Return the cached item set if it was built from the same items.ts, else None."""
+    try:
+        with open(VALID_ITEMS_CACHE_PATH, 'rb') as f:
+            cached_key, items = pickle.load(f)
+    except Exception:
+        return None
+    if cached_key != cache_key or not isinstance(items, frozenset):
+        return None
+    return items
+
+
+def _write_items_disk_cache(cache_key: tuple, items: frozenset) -> None:
+    """Atomically persist the parsed item set (best effort; failures are ignored)."""
+    tmp_path = VALID_ITEMS_CACHE_PATH.with_name(f"{VALID_ITEMS_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        VALID_ITEMS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, items), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, VALID_ITEMS_CACHE_PATH)
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _scan_item_keys(content: bytes):
+    """
+    Yield item IDs (keys in the Items object) from raw items.ts bytes.
+    
+    A key line starts with a tab, then lowercase alphanumerics, then a colon.
+    Single linear pass over the lines, no regex.
+    """
+    for line in content.splitlines():
+        if line[:1] != b'\t':
+            continue
+        colon = line.find(b':', 1)
+        if colon <= 1:
+            continue
+        key = line[1:colon]
+        if not key.translate(None, _ITEM_KEY_BYTES):
+            yield key.decode('ascii')
+
+
+@lru_cache(maxsize=4096)
 def normalize_item_id(item_name: str) -> str:
-    """Convert an item name to its ID (lowercase, no spaces/special chars)"""
+    """Convert an item name to its ID (lowercase, no spaces/special chars). Cached: item names repeat heavily."""
     # Remove spaces, hyphens, apostrophes, etc.
-    return re.sub(r'[^a-z0-9]', '', item_name.lower())
+    item_id = item_name.lower().translate(_NORMALIZE_TABLE)
+    if item_id.isascii():
+        return item_id
+    # Non-ASCII leftovers (e.g. accented letters) are rare; let the regex drop them
+    return _ITEM_ID_RE.sub('', item_id)
 
 
 def is_valid_item(item_name: str) -> bool:
     """Check if an item name is valid according to pokemon-showdown data"""
-    valid_items = get_valid_items()
+    valid_items = _VALID_ITEMS_CACHE or get_valid_items()
     
     if not valid_items:
         # If we can't load the data, assume valid (fail open)
@@ -54,7 +142,41 @@ def is_valid_item(item_name: str) -> bool:
     return item_id in valid_items
 
 
-def validate_packed_team(packed_team: str) -> tuple[bool, list[str]]:
+def _iter_pokemon_bounds(packed_team: str):
+    """Yield (start, end) indices of each ']'-separated Pokemon entry (same pieces as split(']'))."""
+    start = 0
+    while True:
+        end = packed_team.find(']', start)
+        if end < 0:
+            yield start, len(packed_team)
+            return
+        yield start, end
+        start = end + 1
+
+
+def _item_field(packed_team: str, start: int, end: int):
+    """
+    Return the stripped item field (2nd '|' field) of the entry packed_team[start:end],
+    or None if the entry has no item field. Only the item substring is allocated.
+    """
+    first_pipe = packed_team.find('|', start, end)
+    if first_pipe < 0:
+        return None
+    second_pipe = packed_team.find('|', first_pipe + 1, end)
+    if second_pipe < 0:
+        second_pipe = end
+    return packed_team[first_pipe + 1:second_pipe].strip()
+
+
+def _iter_packed_items(packed_team: str):
+    """Yield the non-empty item field of each Pokemon in a packed team."""
+    for start, end in _iter_pokemon_bounds(packed_team):
+        item = _item_field(packed_team, start, end)
+        if item:
+            yield item
+
+
+def validate_packed_team(packed_team: str, fast_fail: bool = False) -> tuple[bool, list[str]]:
     """
     Validate a packed team string.
     
@@ -63,65 +185,100 @@ def validate_packed_team(packed_team: str) -> tuple[bool, list[str]]:
     Each Pokemon has fields separated by '|':
     species|item|ability|moves|nature|evs|gender|ivs|shiny|level|...
     
+    Args:
+        packed_team: Packed team string
+        fast_fail: Stop at the first invalid item (for callers that only need the bool)
+    
     Returns:
         (is_valid, list_of_invalid_items)
     """
-    if DEBUG:
-        print(f"[TeamValidator] validate_packed_team CALLED")
-        print(f"[TeamValidator] Packed team (first 200 chars): {packed_team[:200]}...")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("validate_packed_team CALLED")
+        logger.debug("Packed team (first 200 chars): %s...", packed_team[:200])
     
     if not packed_team:
-        print(f"[TeamValidator] Empty team!")
+        logger.warning("Empty team!")
         return False, ["Empty team"]
     
-    valid_items = get_valid_items()
+    valid_items = _VALID_ITEMS_CACHE or get_valid_items()
     if not valid_items:
-        print(f"[TeamValidator] No valid items loaded, assuming valid")
+        logger.debug("No valid items loaded, assuming valid")
         return True, []  # Can't validate, assume valid
     
     invalid_items = []
+    _norm = normalize_item_id
+    _in = valid_items.__contains__
     
-    # Split by ] to get each Pokemon
-    pokemon_entries = packed_team.split(']')
+    if debug:
+        logger.debug("Found %d Pokemon entries", packed_team.count(']') + 1)
     
-    if DEBUG:
-        print(f"[TeamValidator] Found {len(pokemon_entries)} Pokemon entries")
-    
-    for i, entry in enumerate(pokemon_entries):
-        if not entry.strip():
-            continue
-        
-        # Split by | to get fields
-        fields = entry.split('|')
+    # Walk the ]-separated entries lazily instead of materializing the split list
+    for i, (start, end) in enumerate(_iter_pokemon_bounds(packed_team)):
+        # Item is the 2nd field; located by offset, the entry itself is never sliced
+        item = _item_field(packed_team, start, end)
         
-        if DEBUG:
-            print(f"[TeamValidator] Pokemon {i}: {len(fields)} fields, entry='{entry[:80]}...'")
+        if debug:
+            logger.debug("Pokemon %d: entry='%s...'", i, packed_team[start:min(end, start + 80)])
         
-        # Item is the 2nd field (index 1)
-        if len(fields) > 1:
-            item = fields[1].strip()
-            
-            if DEBUG:
-                print(f"[TeamValidator] Pokemon {i} item field: '{item}'")
+        if item is not None:
+            if debug:
+                logger.debug("Pokemon %d item field: '%s'", i, item)
             
             if item:
-                item_id = normalize_item_id(item)
-                is_valid = item_id in valid_items
+                item_id = _norm(item)
+                is_valid = _in(item_id)
                 
-                if DEBUG:
-                    print(f"[TeamValidator] Item '{item}' -> ID '{item_id}' -> Valid: {is_valid}")
+                if debug:
+                    logger.debug("Item '%s' -> ID '%s' -> Valid: %s", item, item_id, is_valid)
                 
                 if not is_valid:
+                    if fast_fail:
+                        return False, [item]
                     invalid_items.append(item)
     
     is_valid = len(invalid_items) == 0
     
-    if DEBUG:
-        print(f"[TeamValidator] Validation result: valid={is_valid}, invalid_items={invalid_items}")
+    if debug:
+        logger.debug("Validation result: valid=%s, invalid_items=%s", is_valid, invalid_items)
     
     return is_valid, invalid_items
 
 
+def validate_packed_teams_bulk(packed_teams: Iterable[str]) -> list[tuple[bool, list[str]]]:
+    """
+    Validate many packed teams in one pass (e.g. offline team-pool filtering).
+    
+    Each distinct raw item string is normalized and looked up once for the
+    whole batch, instead of once per Pokemon.
+    
+    Returns:
+        One (is_valid, list_of_invalid_items) per team, as validate_packed_team
+    """
+    valid_items = _VALID_ITEMS_CACHE or get_valid_items()
+    verdicts: dict[str, bool] = {}
+    results = []
+    
+    for packed_team in packed_teams:
+        if not packed_team:
+            results.append((False, ["Empty team"]))
+            continue
+        if not valid_items:
+            results.append((True, []))  # Can't validate, assume valid
+            continue
+        
+        invalid_items = []
+        for item in _iter_packed_items(packed_team):
+            is_valid = verdicts.get(item)
+            if is_valid is None:
+                is_valid = verdicts[item] = normalize_item_id(item) in valid_items
+            if not is_valid:
+                invalid_items.append(item)
+        results.append((not invalid_items, invalid_items))
+    
+    return results
+
+
 def validate_showdown_team(showdown_team: str) -> tuple[bool, list[str]]:
     """
     Validate a showdown-format team (before packing).
@@ -129,34 +286,33 @@ def validate_showdown_team(showdown_team: str) -> tuple[bool, list[str]]:
     This is more reliable than validating packed format.
     Looks for lines like: "Pokemon @ ItemName"
     """
-    if DEBUG:
-        print(f"[TeamValidator] validate_showdown_team CALLED")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("validate_showdown_team CALLED")
     
     if not showdown_team:
         return False, ["Empty team"]
     
-    valid_items = get_valid_items()
+    valid_items = _VALID_ITEMS_CACHE or get_valid_items()
     if not valid_items:
         return True, []
     
     invalid_items = []
     
     # Pattern: "PokemonName @ ItemName"
-    item_pattern = r'^.+\s*@\s*(.+)$'
-    
     for line in showdown_team.split('\n'):
-        match = re.match(item_pattern, line.strip())
+        match = _ITEM_LINE_RE.match(line.strip())
         if match:
             item = match.group(1).strip()
             item_id = normalize_item_id(item)
             
-            if DEBUG:
-                print(f"[TeamValidator] Found item line: '{line.strip()}' -> item='{item}' -> id='{item_id}'")
+            if debug:
+                logger.debug("Found item line: '%s' -> item='%s' -> id='%s'", line.strip(), item, item_id)
             
             if item_id and item_id not in valid_items:
                 invalid_items.append(item)
-                if DEBUG:
-                    print(f"[TeamValidator] INVALID ITEM: '{item}'")
+                if debug:
+                    logger.debug("INVALID ITEM: '%s'", item)
     
     is_valid = len(invalid_items) == 0
     return is_valid, invalid_items
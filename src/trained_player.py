@@ -4,6 +4,7 @@ Allows a trained RecurrentPPO model to play as a poke_env Player.
 """
 
 import numpy as np
+import torch
 from typing import Optional, Dict, Any
 
 from poke_env.player import Player
@@ -59,10 +60,27 @@ class TrainedPlayer(Player):
         self.belief_tracker = BeliefTracker(self.pokemon_data)
         self.obs_builder = ObservationBuilder(self.pokemon_data, self.belief_tracker)
         
+        # Bound hot-path methods (skip attribute resolution on every decision)
+        self._embed = self.obs_builder.embed_battle
+        self._predict = self.model.predict
+        
         # LSTM hidden state (for RecurrentPPO)
         self._lstm_states = None
         self._episode_start = True
         self._last_battle_tag = None
+        # Reused episode_start buffer for predict() (filled in place each turn)
+        self._ep_start = np.zeros(1, dtype=np.bool_)
+        
+        # Direct policy path: skip SB3's predict() wrapper (validation, reshaping,
+        # numpy<->torch state round-trips). Only for RecurrentActorCriticPolicy-like
+        # policies; anything else keeps using model.predict().
+        self._policy = getattr(self.model, "policy", None)
+        if not (hasattr(self._policy, "get_distribution") and hasattr(self._policy, "lstm_hidden_state_shape")):
+            self._policy = None
+        if self._policy is not None:
+            self._device = getattr(self.model, "device", torch.device("cpu"))
+            self._ep_start_t = torch.zeros(1, device=self._device)
+            self._policy.set_training_mode(False)
     
     def choose_move(self, battle: AbstractBattle) -> BattleOrder:
         """
@@ -91,16 +109,11 @@ class TrainedPlayer(Player):
         self._update_beliefs(battle)
         
         # Get observation
-        obs = self.obs_builder.embed_battle(battle)
+        obs = self._embed(battle)
         
         # Get action from model
         try:
-            action, self._lstm_states = self.model.predict(
-                obs,
-                state=self._lstm_states,
-                episode_start=np.array([self._episode_start]),
-                deterministic=self.deterministic,
-            )
+            action, self._lstm_states = self._policy_predict(obs)
         except Exception:
             # Never crash callers (training/eval) because a frozen opponent checkpoint is incompatible.
             self._lstm_states = None
@@ -114,20 +127,52 @@ class TrainedPlayer(Player):
         # Convert action to BattleOrder
         return self._action_to_order(battle, action)
     
+    def _policy_predict(self, obs: np.ndarray):
+        """
+        Run one recurrent policy step, returning (action, lstm_states).
+        
+        Uses the policy directly under torch.inference_mode() when possible,
+        falling back to model.predict() otherwise.
+        """
+        if self._policy is not None:
+            try:
+                return self._policy_step(obs)
+            except Exception:
+                # Policy layout differs from what we expect; use predict() from now on.
+                self._policy = None
+                self._lstm_states = None
+        
+        self._ep_start[0] = self._episode_start
+        return self._predict(
+            obs,
+            state=self._lstm_states,
+            episode_start=self._ep_start,
+            deterministic=self.deterministic,
+        )
+    
+    def _policy_step(self, obs: np.ndarray):
+        """Single actor step on the underlying RecurrentActorCriticPolicy (mirrors policy._predict)."""
+        with torch.inference_mode():
+            obs_t = torch.as_tensor(obs, device=self._device).unsqueeze(0)
+            states = self._lstm_states
+            if states is None:
+                zeros = torch.zeros(self._policy.lstm_hidden_state_shape, device=self._device)
+                states = (zeros, zeros)
+            self._ep_start_t.fill_(float(self._episode_start))
+            distribution, states = self._policy.get_distribution(obs_t, states, self._ep_start_t)
+            action = distribution.get_actions(deterministic=self.deterministic)
+        return action, states
+    
     def _update_beliefs(self, battle: AbstractBattle):
         """Update belief tracker based on battle events."""
+        update_batch = self.belief_tracker.update_batch
         for pokemon in battle.opponent_team.values():
-            species = pokemon.species
-            
-            if pokemon.moves:
-                for move_id in pokemon.moves:
-                    self.belief_tracker.update(species, observed_move=move_id)
-            
-            if pokemon.item:
-                self.belief_tracker.update(species, observed_item=pokemon.item)
-            
-            if pokemon.ability:
-                self.belief_tracker.update(species, observed_ability=pokemon.ability)
+            update_batch(
+                pokemon.species,
+                moves=pokemon.moves,
+                item=pokemon.item,
+                ability=pokemon.ability,
+            )
     
     def _action_to_order(self, battle: AbstractBattle, action: int) -> BattleOrder:
         """
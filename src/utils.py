@@ -4,11 +4,20 @@ Includes type mappings, data loading, and helper functions.
 """
 
 import json
+import os
+import pickle
+import sys
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, FrozenSet, List, Optional, Any, Sequence
 import numpy as np
 
+
+@lru_cache(maxsize=4096)
+def _norm(name: str) -> str:
+    """Normalize an ability/item/move name to its Showdown ID (cached, interned)."""
+    return sys.intern(name.lower().replace(' ', '').replace('-', '').replace("'", ''))
+
 # Pokemon type effectiveness chart
 # Order: Normal, Fire, Water, Electric, Grass, Ice, Fighting, Poison, 
 #        Ground, Flying, Psychic, Bug, Rock, Ghost, Dragon, Dark, Steel, Fairy
@@ -21,66 +30,127 @@ TYPE_LIST = [
 TYPE_TO_ID = {t: i for i, t in enumerate(TYPE_LIST)}
 NUM_TYPES = len(TYPE_LIST)
 
+# Type effectiveness stored as int8 log2 exponents (attacker x defender)
+# -1 = not very effective, 0 = neutral, 1 = super effective, _X = immune.
+# The immune sentinel is chosen so the sum over two defender types still fits
+# in int8; any summed exponent below -2 means the attack has no effect.
+IMMUNE_LOG2 = -64
+_X = IMMUNE_LOG2
+_TYPE_CHART_LOG2 = np.array([
+    # Nor Fir Wat Ele Gra Ice Fig Poi Gro Fly Psy Bug Roc Gho Dra Dar Ste Fai
+    [  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, -1, _X,  0,  0, -1,  0],  # Normal
+    [  0, -1, -1,  0,  1,  1,  0,  0,  0,  0,  0,  1, -1,  0, -1,  0,  1,  0],  # Fire
+    [  0,  1, -1,  0, -1,  0,  0,  0,  1,  0,  0,  0,  1,  0, -1,  0,  0,  0],  # Water
+    [  0,  0,  1, -1, -1,  0,  0,  0, _X,  1,  0,  0,  0,  0, -1,  0,  0,  0],  # Electric
+    [  0, -1,  1,  0, -1,  0,  0, -1,  1, -1,  0, -1,  1,  0, -1,  0, -1,  0],  # Grass
+    [  0, -1, -1,  0,  1, -1,  0,  0,  1,  1,  0,  0,  0,  0,  1,  0, -1,  0],  # Ice
+    [  1,  0,  0,  0,  0,  1,  0, -1,  0, -1, -1, -1,  1, _X,  0,  1,  1, -1],  # Fighting
+    [  0,  0,  0,  0,  1,  0,  0, -1, -1,  0,  0,  0, -1, -1,  0,  0, _X,  1],  # Poison
+    [  0,  1,  0,  1, -1,  0,  0,  1,  0, _X,  0, -1,  1,  0,  0,  0,  1,  0],  # Ground
+    [  0,  0,  0, -1,  1,  0,  1,  0,  0,  0,  0,  1, -1,  0,  0,  0, -1,  0],  # Flying
+    [  0,  0,  0,  0,  0,  0,  1,  1,  0,  0, -1,  0,  0,  0,  0, _X, -1,  0],  # Psychic
+    [  0, -1,  0,  0,  1,  0, -1, -1,  0, -1,  1,  0,  0, -1,  0,  1, -1, -1],  # Bug
+    [  0,  1,  0,  0,  0,  1, -1,  0, -1,  1,  0,  1,  0,  0,  0,  0, -1,  0],  # Rock
+    [ _X,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  1,  0, -1,  0,  0],  # Ghost
+    [  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  0, -1, _X],  # Dragon
+    [  0,  0,  0,  0,  0,  0, -1,  0,  0,  0,  1,  0,  0,  1,  0, -1,  0, -1],  # Dark
+    [  0, -1, -1, -1,  0,  1,  0,  0,  0,  0,  0,  0,  1,  0,  0,  0, -1,  1],  # Steel
+    [  0, -1,  0,  0,  0,  0,  1, -1,  0,  0,  0,  0,  0,  0,  1,  1, -1,  0],  # Fairy
+], dtype=np.int8)
+_TYPE_CHART_LOG2.flags.writeable = False
+del _X
+
+
+def log2_to_multiplier(log2: np.ndarray) -> np.ndarray:
+    """Convert (summed) log2 effectiveness exponents to float32 multipliers."""
+    log2 = np.asarray(log2)
+    return np.where(log2 < -2, 0.0, np.exp2(log2.astype(np.float32))).astype(np.float32)
+
+
 # Type effectiveness matrix (attacker x defender)
 # 0 = immune, 0.5 = not very effective, 1 = neutral, 2 = super effective
-TYPE_CHART = np.array([
-    # Nor Fir Wat Ele Gra Ice Fig Poi Gro Fly Psy Bug Roc Gho Dra Dar Ste Fai
-    [1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1, .5,  0,  1,  1, .5,  1],  # Normal
-    [1, .5, .5,  1,  2,  2,  1,  1,  1,  1,  1,  2, .5,  1, .5,  1,  2,  1],  # Fire
-    [1,  2, .5,  1, .5,  1,  1,  1,  2,  1,  1,  1,  2,  1, .5,  1,  1,  1],  # Water
-    [1,  1,  2, .5, .5,  1,  1,  1,  0,  2,  1,  1,  1,  1, .5,  1,  1,  1],  # Electric
-    [1, .5,  2,  1, .5,  1,  1, .5,  2, .5,  1, .5,  2,  1, .5,  1, .5,  1],  # Grass
-    [1, .5, .5,  1,  2, .5,  1,  1,  2,  2,  1,  1,  1,  1,  2,  1, .5,  1],  # Ice
-    [2,  1,  1,  1,  1,  2,  1, .5,  1, .5, .5, .5,  2,  0,  1,  2,  2, .5],  # Fighting
-    [1,  1,  1,  1,  2,  1,  1, .5, .5,  1,  1,  1, .5, .5,  1,  1,  0,  2],  # Poison
-    [1,  2,  1,  2, .5,  1,  1,  2,  1,  0,  1, .5,  2,  1,  1,  1,  2,  1],  # Ground
-    [1,  1,  1, .5,  2,  1,  2,  1,  1,  1,  1,  2, .5,  1,  1,  1, .5,  1],  # Flying
-    [1,  1,  1,  1,  1,  1,  2,  2,  1,  1, .5,  1,  1,  1,  1,  0, .5,  1],  # Psychic
-    [1, .5,  1,  1,  2,  1, .5, .5,  1, .5,  2,  1,  1, .5,  1,  2, .5, .5],  # Bug
-    [1,  2,  1,  1,  1,  2, .5,  1, .5,  2,  1,  2,  1,  1,  1,  1, .5,  1],  # Rock
-    [0,  1,  1,  1,  1,  1,  1,  1,  1,  1,  2,  1,  1,  2,  1, .5,  1,  1],  # Ghost
-    [1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  2,  1, .5,  0],  # Dragon
-    [1,  1,  1,  1,  1,  1, .5,  1,  1,  1,  2,  1,  1,  2,  1, .5,  1, .5],  # Dark
-    [1, .5, .5, .5,  1,  2,  1,  1,  1,  1,  1,  1,  2,  1,  1,  1, .5,  2],  # Steel
-    [1, .5,  1,  1,  1,  1,  2, .5,  1,  1,  1,  1,  1,  1,  2,  2, .5,  1],  # Fairy
-], dtype=np.float32)
+# Read-only and C-contiguous, like every lookup table in this module, so it
+# can be shared safely (including across forked workers)
+TYPE_CHART = np.ascontiguousarray(log2_to_multiplier(_TYPE_CHART_LOG2))
+TYPE_CHART.flags.writeable = False
 
 
-@lru_cache(maxsize=1024)
-def get_type_effectiveness(atk_type: str, def_type1: str, def_type2: Optional[str] = None) -> float:
-    """Calculate type effectiveness multiplier. Cached for performance."""
-    atk_lower = atk_type.lower() if atk_type else 'normal'
-    if atk_lower not in TYPE_TO_ID:
-        return 1.0
-    atk_id = TYPE_TO_ID[atk_lower]
-    
-    mult = 1.0
-    if def_type1:
-        def1_lower = def_type1.lower()
-        if def1_lower in TYPE_TO_ID:
-            mult *= TYPE_CHART[atk_id, TYPE_TO_ID[def1_lower]]
-    if def_type2:
-        def2_lower = def_type2.lower()
-        if def2_lower in TYPE_TO_ID:
-            mult *= TYPE_CHART[atk_id, TYPE_TO_ID[def2_lower]]
+def type_matchup_log2_batch(atk_ids: np.ndarray, def_ids: np.ndarray) -> np.ndarray:
+    """
+    Raw int8 log2 effectiveness exponents for paired attacker/defender type IDs.
     
-    return mult
+    Exponents for two defender types can be summed (stays within int8) and
+    converted once with log2_to_multiplier.
+    """
+    return _TYPE_CHART_LOG2[np.asarray(atk_ids, dtype=np.intp), np.asarray(def_ids, dtype=np.intp)]
+
+
+# Index used for a missing or unknown type; it is neutral (1x) on both sides
+NO_TYPE_ID = NUM_TYPES
+
+# Combined effectiveness for every (attacker, type1, type2) combination,
+# including NO_TYPE_ID on each axis, so lookups need no branching or caching
+_TYPE_CHART_PADDED = np.ones((NUM_TYPES + 1, NUM_TYPES + 1), dtype=np.float32)
+_TYPE_CHART_PADDED[:NUM_TYPES, :NUM_TYPES] = TYPE_CHART
+_TYPE_CHART_PADDED.flags.writeable = False
+TYPE_EFFECT_PAIR = np.ascontiguousarray(np.einsum('ij,ik->ijk', _TYPE_CHART_PADDED, _TYPE_CHART_PADDED))
+TYPE_EFFECT_PAIR.flags.writeable = False
+# Nested Python floats for scalar lookups (cheaper than NumPy scalar indexing)
+_TYPE_EFFECT_PAIR_LIST = TYPE_EFFECT_PAIR.tolist()
+
+
+def _type_id(type_name: Optional[str]) -> int:
+    """Type ID of a type name, NO_TYPE_ID if missing or unknown."""
+    if not type_name:
+        return NO_TYPE_ID
+    return TYPE_TO_ID.get(type_name.lower(), NO_TYPE_ID)
+
+
+def get_type_effectiveness_ids(atk_id: int, def1_id: int, def2_id: int = NO_TYPE_ID) -> float:
+    """Type effectiveness multiplier from type IDs (NO_TYPE_ID for a missing type)."""
+    return _TYPE_EFFECT_PAIR_LIST[atk_id][def1_id][def2_id]
+
+
+def _type_effectiveness_slow(atk_type: str, def_type1: str, def_type2: Optional[str]) -> float:
+    atk_id = _type_id(atk_type) if atk_type else TYPE_TO_ID['normal']
+    return _TYPE_EFFECT_PAIR_LIST[atk_id][_type_id(def_type1)][_type_id(def_type2)]
+
+
+# Every multiplier keyed directly by lowercase names (plus None/'' for missing
+# types), so the common call is three dict probes and no string handling
+_TYPE_NAME_KEYS = TYPE_LIST + [None, '']
+_TYPE_EFFECT_BY_NAME = {
+    atk: {
+        d1: {d2: _type_effectiveness_slow(atk, d1, d2) for d2 in _TYPE_NAME_KEYS}
+        for d1 in _TYPE_NAME_KEYS
+    }
+    for atk in _TYPE_NAME_KEYS
+}
+
+
+def get_type_effectiveness(atk_type: str, def_type1: str, def_type2: Optional[str] = None) -> float:
+    """Calculate type effectiveness multiplier (unknown attacking types are neutral)."""
+    try:
+        return _TYPE_EFFECT_BY_NAME[atk_type][def_type1][def_type2]
+    except KeyError:
+        # Mixed case or unknown names
+        return _type_effectiveness_slow(atk_type, def_type1, def_type2)
 
 
 # Ability-based type immunities
-ABILITY_IMMUNITIES: Dict[str, Set[str]] = {
-    'levitate': {'ground'},
-    'flashfire': {'fire'},
-    'waterabsorb': {'water'},
-    'voltabsorb': {'electric'},
-    'lightningrod': {'electric'},
-    'stormdrain': {'water'},
-    'sapsipper': {'grass'},
-    'motordrive': {'electric'},
-    'dryskin': {'water'},
-    'eartheater': {'ground'},
-    'heatproof': set(),  # Not immune, just resistant
-    'thickfat': set(),   # Not immune, just resistant
+ABILITY_IMMUNITIES: Dict[str, FrozenSet[str]] = {
+    'levitate': frozenset({'ground'}),
+    'flashfire': frozenset({'fire'}),
+    'waterabsorb': frozenset({'water'}),
+    'voltabsorb': frozenset({'electric'}),
+    'lightningrod': frozenset({'electric'}),
+    'stormdrain': frozenset({'water'}),
+    'sapsipper': frozenset({'grass'}),
+    'motordrive': frozenset({'electric'}),
+    'dryskin': frozenset({'water'}),
+    'eartheater': frozenset({'ground'}),
+    'heatproof': frozenset(),  # Not immune, just resistant
+    'thickfat': frozenset(),   # Not immune, just resistant
 }
 
 
@@ -97,20 +167,31 @@ def is_immune_by_ability(move_type: str, ability: Optional[str]) -> bool:
     """
     if not ability:
         return False
-    ability_norm = ability.lower().replace(' ', '').replace('-', '')
+    ability_norm = _norm(ability)
     type_norm = move_type.lower() if move_type else ''
-    immune_types = ABILITY_IMMUNITIES.get(ability_norm, set())
+    immune_types = ABILITY_IMMUNITIES.get(ability_norm, frozenset())
     return type_norm in immune_types
 
 
+# One-hot rows are shared read-only views; row NO_TYPE_ID is all zeros
+_TYPE_ONEHOT = np.vstack([np.eye(NUM_TYPES, dtype=np.float32), np.zeros((1, NUM_TYPES), dtype=np.float32)])
+_TYPE_ONEHOT.flags.writeable = False
+
+
 def type_to_onehot(type_name: Optional[str]) -> np.ndarray:
-    """Convert Pokemon type to one-hot encoding."""
-    arr = np.zeros(NUM_TYPES, dtype=np.float32)
-    if type_name:
-        t_id = TYPE_TO_ID.get(type_name.lower())
-        if t_id is not None:
-            arr[t_id] = 1.0
-    return arr
+    """Convert Pokemon type to one-hot encoding (read-only, copy before mutating)."""
+    if not type_name:
+        return _TYPE_ONEHOT[NO_TYPE_ID]
+    return _TYPE_ONEHOT[TYPE_TO_ID.get(type_name.lower(), NO_TYPE_ID)]
+
+
+def types_to_onehot_batch(type_names: Sequence[Optional[str]]) -> np.ndarray:
+    """One-hot encode a sequence of types into an (N, NUM_TYPES) array."""
+    ids = np.fromiter(
+        (TYPE_TO_ID.get(t.lower(), NO_TYPE_ID) if t else NO_TYPE_ID for t in type_names),
+        dtype=np.intp, count=len(type_names),
+    )
+    return _TYPE_ONEHOT[ids]
 
 
 # Status conditions
@@ -119,16 +200,24 @@ STATUS_TO_ID = {s: i for i, s in enumerate(STATUS_LIST)}
 NUM_STATUS = len(STATUS_LIST)
 
 
+_STATUS_ONEHOT = np.eye(NUM_STATUS, dtype=np.float32)
+_STATUS_ONEHOT.flags.writeable = False
+
+
 def status_to_onehot(status: Optional[str]) -> np.ndarray:
-    """Convert status to one-hot encoding."""
-    arr = np.zeros(NUM_STATUS, dtype=np.float32)
+    """Convert status to one-hot encoding (read-only, copy before mutating)."""
     if status is None:
-        arr[0] = 1.0
-    elif status.lower() in STATUS_TO_ID:
-        arr[STATUS_TO_ID[status.lower()]] = 1.0
-    else:
-        arr[0] = 1.0  # Unknown status treated as none
-    return arr
+        return _STATUS_ONEHOT[0]
+    return _STATUS_ONEHOT[STATUS_TO_ID.get(status.lower(), 0)]  # Unknown status treated as none
+
+
+def statuses_to_onehot_batch(statuses: Sequence[Optional[str]]) -> np.ndarray:
+    """One-hot encode a sequence of statuses into an (N, NUM_STATUS) array."""
+    ids = np.fromiter(
+        (STATUS_TO_ID.get(s.lower(), 0) if s is not None else 0 for s in statuses),
+        dtype=np.intp, count=len(statuses),
+    )
+    return _STATUS_ONEHOT[ids]
 
 
 # Weather conditions
@@ -155,21 +244,56 @@ SIDE_CONDITIONS = [
 NUM_SIDE_CONDITIONS = len(SIDE_CONDITIONS)
 
 
-def load_pokemon_data(filepath: str = "gen9randombattle.json") -> Dict[str, Any]:
-    """Load Pokemon role/set data from JSON file."""
+def load_pokemon_data_fast(filepath: str = "gen9randombattle.json") -> Dict[str, Any]:
+    """
+    Load Pokemon role/set data, preferring a pickled sidecar of the JSON file.
+    
+    The sidecar (same name, .pkl suffix) is rebuilt whenever the JSON file's
+    size or mtime changes; failures to read or write it fall back to JSON.
+    """
     path = Path(filepath)
     if not path.exists():
         # Try relative to project root
         path = Path(__file__).parent.parent / filepath
     
+    stat = path.stat()
+    cache_key = (stat.st_size, stat.st_mtime_ns)
+    sidecar = path.with_suffix('.pkl')
+    try:
+        with open(sidecar, 'rb') as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == cache_key:
+            return data
+    except Exception:
+        pass
+    
     with open(path, 'r') as f:
-        return json.load(f)
+        data = json.load(f)
+    
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, sidecar)
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return data
+
+
+@lru_cache(maxsize=4)
+def load_pokemon_data(filepath: str = "gen9randombattle.json") -> Dict[str, Any]:
+    """Load Pokemon role/set data from JSON file (cached; treat the result as read-only)."""
+    return load_pokemon_data_fast(filepath)
 
 
+@lru_cache(maxsize=2048)
 def normalize_species_name(name: str) -> str:
-    """Normalize Pokemon species name for lookup."""
+    """Normalize Pokemon species name for lookup (cached, interned)."""
     # Remove special characters and lowercase
-    return name.lower().replace("-", "").replace(" ", "").replace(".", "").replace("'", "")
+    return sys.intern(name.lower().replace("-", "").replace(" ", "").replace(".", "").replace("'", ""))
 
 
 def get_species_from_pokemon(pokemon) -> str:
@@ -179,35 +303,41 @@ def get_species_from_pokemon(pokemon) -> str:
     return normalize_species_name(str(pokemon))
 
 
-# Stat boost multipliers
-BOOST_MULTIPLIERS = {
-    -6: 2/8, -5: 2/7, -4: 2/6, -3: 2/5, -2: 2/4, -1: 2/3,
-    0: 1.0,
-    1: 3/2, 2: 4/2, 3: 5/2, 4: 6/2, 5: 7/2, 6: 8/2
-}
+# Stat boost multipliers, indexed by boost stage + 6.  Kept in float64 so the
+# scalar path matches Showdown's integer stat math exactly.
+_BOOST_LUT = np.array([2/8, 2/7, 2/6, 2/5, 2/4, 2/3, 1.0, 3/2, 4/2, 5/2, 6/2, 7/2, 8/2], dtype=np.float64)
+_BOOST_LUT.flags.writeable = False
 
 
 def boost_to_multiplier(boost: int) -> float:
     """Convert stat boost stage to multiplier."""
-    boost = max(-6, min(6, boost))
-    return BOOST_MULTIPLIERS[boost]
+    return float(_BOOST_LUT[max(-6, min(6, boost)) + 6])
+
+
+def boosts_to_multipliers(boosts: np.ndarray) -> np.ndarray:
+    """Convert an array of boost stages to multipliers in one gather."""
+    return _BOOST_LUT[np.clip(np.asarray(boosts, dtype=np.intp), -6, 6) + 6]
+
+
+# Order: atk, def, spa, spd, spe, accuracy, evasion
+_STAT_ORDER = ('atk', 'def', 'spa', 'spd', 'spe', 'accuracy', 'evasion')
+
+
+@lru_cache(maxsize=1024)
+def _boost_stages_to_array(stages: tuple) -> np.ndarray:
+    """Clamp and normalize one tuple of boost stages (cached, read-only)."""
+    arr = (np.clip(np.array(stages, dtype=np.float64), -6, 6) / 6.0).astype(np.float32)
+    arr.flags.writeable = False
+    return arr
 
 
 def boosts_to_array(boosts: Dict[str, int]) -> np.ndarray:
-    """Convert boosts dict to normalized array.
+    """Convert boosts dict to normalized array (read-only, copy before mutating).
     
     Clamps values to [-6, 6] to prevent the agent from perceiving
     or chasing boosts beyond the game's maximum.
     """
-    # Order: atk, def, spa, spd, spe, accuracy, evasion
-    stat_order = ['atk', 'def', 'spa', 'spd', 'spe', 'accuracy', 'evasion']
-    arr = np.zeros(7, dtype=np.float32)
-    for i, stat in enumerate(stat_order):
-        if stat in boosts:
-            # Clamp to valid range and normalize to [-1, 1]
-            clamped = max(-6, min(6, boosts[stat]))
-            arr[i] = clamped / 6.0
-    return arr
+    return _boost_stages_to_array(tuple([boosts.get(stat, 0) for stat in _STAT_ORDER]))
 
 
 def calculate_speed(base_speed: int, level: int, boost: int = 0, 
@@ -234,18 +364,48 @@ def calculate_speed(base_speed: int, level: int, boost: int = 0,
     return float(stat)
 
 
+def calculate_speeds_batch(base_speed: np.ndarray, level: np.ndarray, boost: np.ndarray = 0,
+                           paralyzed: np.ndarray = False, tailwind: np.ndarray = False,
+                           is_scarfed: np.ndarray = False) -> np.ndarray:
+    """Vectorized calculate_speed over arrays (e.g. all 12 Pokemon at once)."""
+    base_speed = np.asarray(base_speed, dtype=np.int64)
+    level = np.asarray(level, dtype=np.int64)
+    stat = np.floor((2 * base_speed + 31 + 85 // 4) * level / 100 + 5)
+    stat = np.floor(stat * boosts_to_multipliers(boost))
+    stat = np.where(paralyzed, stat // 2, stat)
+    stat = np.where(tailwind, stat * 2, stat)
+    stat = np.where(is_scarfed, np.floor(stat * 1.5), stat)
+    return stat.astype(np.float32)
+
+
 # Move categories
 MOVE_CATEGORY_LIST = ["physical", "special", "status"]
 MOVE_CATEGORY_TO_ID = {c: i for i, c in enumerate(MOVE_CATEGORY_LIST)}
 
 
+NUM_MOVE_CATEGORIES = len(MOVE_CATEGORY_LIST)
+
+# Last row is all zeros for unknown categories
+_CATEGORY_ONEHOT = np.vstack([
+    np.eye(NUM_MOVE_CATEGORIES, dtype=np.float32),
+    np.zeros((1, NUM_MOVE_CATEGORIES), dtype=np.float32),
+])
+_CATEGORY_ONEHOT.flags.writeable = False
+
+
 def move_category_to_onehot(category: str) -> np.ndarray:
-    """Convert move category to one-hot encoding."""
-    arr = np.zeros(3, dtype=np.float32)
+    """Convert move category to one-hot encoding (read-only, copy before mutating)."""
     cat = category.lower() if category else "status"
-    if cat in MOVE_CATEGORY_TO_ID:
-        arr[MOVE_CATEGORY_TO_ID[cat]] = 1.0
-    return arr
+    return _CATEGORY_ONEHOT[MOVE_CATEGORY_TO_ID.get(cat, NUM_MOVE_CATEGORIES)]
+
+
+def move_categories_to_onehot_batch(categories: Sequence[Optional[str]]) -> np.ndarray:
+    """One-hot encode a sequence of move categories into an (N, 3) array."""
+    ids = np.fromiter(
+        (MOVE_CATEGORY_TO_ID.get(c.lower() if c else "status", NUM_MOVE_CATEGORIES) for c in categories),
+        dtype=np.intp, count=len(categories),
+    )
+    return _CATEGORY_ONEHOT[ids]
 
 
 # =============================================================================
@@ -296,10 +456,10 @@ TERRAIN_ABILITIES = {
 }
 
 # Abilities that punish contact moves
-CONTACT_PUNISHMENT_ABILITIES = {
+CONTACT_PUNISHMENT_ABILITIES = frozenset({
     'roughskin', 'ironbarbs', 'flamebody', 'static', 'effectspore',
     'poisonpoint', 'cutecharm', 'gooey', 'tanglinghair',
-}
+})
 
 # Abilities that boost specific stats
 BOOST_ABILITIES = {
@@ -314,11 +474,73 @@ BOOST_ABILITIES = {
 }
 
 
+# Bit positions of the ability flags (same order as get_ability_flags)
+ABILITY_IMMUNITY_BIT = 1 << 0
+ABILITY_PRIORITY_BIT = 1 << 1
+ABILITY_WEATHER_BIT = 1 << 2
+ABILITY_TERRAIN_BIT = 1 << 3
+ABILITY_CONTACT_PUNISH_BIT = 1 << 4
+ABILITY_BOOST_BIT = 1 << 5
+ABILITY_INTIMIDATE_BIT = 1 << 6
+ABILITY_KNOWN_BIT = 1 << 7
+NUM_ABILITY_FLAGS = 8
+
+
+def _compute_ability_bits(ability_lower: str) -> int:
+    """Evaluate the flag membership tests for one normalized ability."""
+    bits = ABILITY_KNOWN_BIT
+    if ability_lower in IMMUNITY_ABILITIES:
+        bits |= ABILITY_IMMUNITY_BIT
+    if ability_lower in PRIORITY_ABILITIES:
+        bits |= ABILITY_PRIORITY_BIT
+    if ability_lower in WEATHER_ABILITIES:
+        bits |= ABILITY_WEATHER_BIT
+    if ability_lower in TERRAIN_ABILITIES:
+        bits |= ABILITY_TERRAIN_BIT
+    if ability_lower in CONTACT_PUNISHMENT_ABILITIES:
+        bits |= ABILITY_CONTACT_PUNISH_BIT
+    if ability_lower in BOOST_ABILITIES:
+        bits |= ABILITY_BOOST_BIT
+    if ability_lower == 'intimidate':
+        bits |= ABILITY_INTIMIDATE_BIT
+    return bits
+
+
+# Every ability this module knows about, with one precomputed flag bitmask each.
+# Two extra entries follow: an unlisted ability (only is_known set) and no ability.
+_ABILITY_VOCAB = sorted(
+    set(IMMUNITY_ABILITIES) | set(PRIORITY_ABILITIES) | set(WEATHER_ABILITIES)
+    | set(TERRAIN_ABILITIES) | CONTACT_PUNISHMENT_ABILITIES | set(BOOST_ABILITIES)
+    | set(ABILITY_IMMUNITIES)
+)
+_ABILITY_ID: Dict[str, int] = {a: i for i, a in enumerate(_ABILITY_VOCAB)}
+_UNKNOWN_ABILITY_ROW = len(_ABILITY_VOCAB)
+_NO_ABILITY_ROW = _UNKNOWN_ABILITY_ROW + 1
+_ABILITY_FLAG_BITS = np.array(
+    [_compute_ability_bits(a) for a in _ABILITY_VOCAB] + [ABILITY_KNOWN_BIT, 0],
+    dtype=np.uint16,
+)
+_ABILITY_FLAG_BITS.flags.writeable = False
+
+# Expands a bitmask into the float32 flag vector used by the observation
+_ABILITY_BITS_TO_FLAGS = (
+    (np.arange(1 << NUM_ABILITY_FLAGS)[:, None] >> np.arange(NUM_ABILITY_FLAGS)) & 1
+).astype(np.float32)
+_ABILITY_BITS_TO_FLAGS.flags.writeable = False
+
+
+def get_ability_bits(ability: Optional[str]) -> int:
+    """Get the ability flags as a bitmask of the ABILITY_*_BIT constants."""
+    if not ability:
+        return 0
+    return int(_ABILITY_FLAG_BITS[_ABILITY_ID.get(_norm(ability), _UNKNOWN_ABILITY_ROW)])
+
+
 def get_ability_flags(ability: Optional[str]) -> np.ndarray:
     """
     Get strategic flags for an ability.
     
-    Returns 8 flags:
+    Returns 8 flags (read-only, copy before mutating):
     - grants_immunity (1): Ability grants type immunity
     - affects_priority (1): Ability changes move priority  
     - sets_weather (1): Ability sets weather
@@ -328,39 +550,116 @@ def get_ability_flags(ability: Optional[str]) -> np.ndarray:
     - is_intimidate (1): Specifically Intimidate (very common)
     - is_known (1): Ability is known at all
     """
-    flags = np.zeros(8, dtype=np.float32)
-    
-    if not ability:
-        return flags
-    
-    ability_lower = ability.lower().replace(' ', '').replace('-', '')
-    
-    flags[0] = 1.0 if ability_lower in IMMUNITY_ABILITIES else 0.0
-    flags[1] = 1.0 if ability_lower in PRIORITY_ABILITIES else 0.0
-    flags[2] = 1.0 if ability_lower in WEATHER_ABILITIES else 0.0
-    flags[3] = 1.0 if ability_lower in TERRAIN_ABILITIES else 0.0
-    flags[4] = 1.0 if ability_lower in CONTACT_PUNISHMENT_ABILITIES else 0.0
-    flags[5] = 1.0 if ability_lower in BOOST_ABILITIES else 0.0
-    flags[6] = 1.0 if ability_lower == 'intimidate' else 0.0
-    flags[7] = 1.0  # Is known
-    
-    return flags
+    return _ABILITY_BITS_TO_FLAGS[get_ability_bits(ability)]
 
 
 def get_immunity_type(ability: Optional[str]) -> Optional[str]:
     """Get the type this ability grants immunity to, if any."""
     if not ability:
         return None
-    ability_lower = ability.lower().replace(' ', '').replace('-', '')
+    ability_lower = _norm(ability)
     return IMMUNITY_ABILITIES.get(ability_lower)
 
 
+def get_ability_id(ability: Optional[str]) -> int:
+    """Row index of an ability in the per-ability tables (unknown/missing get their own rows)."""
+    if not ability:
+        return _NO_ABILITY_ROW
+    return _ABILITY_ID.get(_norm(ability), _UNKNOWN_ABILITY_ROW)
+
+
+def get_ability_ids(abilities: Sequence[Optional[str]]) -> np.ndarray:
+    """Vectorized get_ability_id, for indexing the ABILITY_* per-ability arrays."""
+    return np.fromiter((get_ability_id(a) for a in abilities), dtype=np.intp, count=len(abilities))
+
+
+def _ability_column(values: List[Any], dtype) -> np.ndarray:
+    """Per-ability array over _ABILITY_VOCAB plus the unknown/none rows (read-only)."""
+    empty = False if dtype is np.bool_ else -1
+    arr = np.array(values + [empty, empty], dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+
+# Ability metadata as parallel arrays indexed by get_ability_id / get_ability_ids
+# (-1 = not applicable), so team-wide questions are one fancy index.
+PRIORITY_KIND_LIST = list(dict.fromkeys(PRIORITY_ABILITIES.values()))
+BOOST_KIND_LIST = list(dict.fromkeys(BOOST_ABILITIES.values()))
+
+# Weather ID from WEATHER_LIST
+ABILITY_SETS_WEATHER = _ability_column(
+    [WEATHER_TO_ID.get(WEATHER_ABILITIES.get(a), -1) for a in _ABILITY_VOCAB], np.int8)
+# Terrain ID from GLOBAL_FIELD_LIST (also covers Hadron Engine, listed with the weather setters)
+ABILITY_SETS_TERRAIN = _ability_column(
+    [GLOBAL_FIELD_TO_ID.get(TERRAIN_ABILITIES.get(a, WEATHER_ABILITIES.get(a)), -1) for a in _ABILITY_VOCAB],
+    np.int8)
+# Type ID from IMMUNITY_ABILITIES
+ABILITY_IMMUNE_TO = _ability_column(
+    [TYPE_TO_ID.get(IMMUNITY_ABILITIES.get(a), -1) for a in _ABILITY_VOCAB], np.int8)
+# Index into PRIORITY_KIND_LIST
+ABILITY_PRIORITY_KIND = _ability_column(
+    [PRIORITY_KIND_LIST.index(PRIORITY_ABILITIES[a]) if a in PRIORITY_ABILITIES else -1 for a in _ABILITY_VOCAB],
+    np.int8)
+ABILITY_PUNISHES_CONTACT = _ability_column(
+    [a in CONTACT_PUNISHMENT_ABILITIES for a in _ABILITY_VOCAB], np.bool_)
+# Index into BOOST_KIND_LIST
+ABILITY_BOOST_KIND = _ability_column(
+    [BOOST_KIND_LIST.index(BOOST_ABILITIES[a]) if a in BOOST_ABILITIES else -1 for a in _ABILITY_VOCAB],
+    np.int8)
+
+
+# Per-ability bitmask of immune attacking types (bit = type ID), from ABILITY_IMMUNITIES
+_ABILITY_IMMUNE_TYPES = np.array(
+    [sum(1 << TYPE_TO_ID[t] for t in ABILITY_IMMUNITIES.get(a, ())) for a in _ABILITY_VOCAB] + [0, 0],
+    dtype=np.int32,
+)
+_ABILITY_IMMUNE_TYPES.flags.writeable = False
+_ABILITY_IMMUNE_TYPES_LIST = _ABILITY_IMMUNE_TYPES.tolist()
+
+
+def effectiveness_vs(atk_id: int, def1_id: int, def2_id: int, ability_id: int) -> float:
+    """
+    Type effectiveness against a defender, zeroed if its ability grants immunity.
+    
+    Fuses get_type_effectiveness_ids with is_immune_by_ability; ability_id
+    comes from get_ability_id.
+    """
+    if (_ABILITY_IMMUNE_TYPES_LIST[ability_id] >> atk_id) & 1:
+        return 0.0
+    return _TYPE_EFFECT_PAIR_LIST[atk_id][def1_id][def2_id]
+
+
+def effectiveness_vs_batch(atk_ids: np.ndarray, def1_ids: np.ndarray, def2_ids: np.ndarray,
+                           ability_ids: np.ndarray) -> np.ndarray:
+    """Vectorized effectiveness_vs; inputs broadcast (e.g. moves x opponents)."""
+    atk_ids = np.asarray(atk_ids, dtype=np.intp)
+    ability_ids = np.asarray(ability_ids, dtype=np.intp)
+    immune = (_ABILITY_IMMUNE_TYPES[ability_ids] >> atk_ids) & 1
+    return np.where(immune != 0, np.float32(0.0), TYPE_EFFECT_PAIR[atk_ids, def1_ids, def2_ids])
+
+
+def effectiveness_grid(move_type_ids: np.ndarray, def1_ids: np.ndarray, def2_ids: np.ndarray,
+                       ability_ids: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Effectiveness of M move types against D defenders as an (M, D) float32 grid.
+    
+    Missing defender types use NO_TYPE_ID. If ability_ids (from get_ability_ids)
+    is given, cells where the defender's ability grants immunity are zeroed.
+    """
+    atk = np.asarray(move_type_ids, dtype=np.intp)[:, None]
+    def1 = np.asarray(def1_ids, dtype=np.intp)[None, :]
+    def2 = np.asarray(def2_ids, dtype=np.intp)[None, :]
+    if ability_ids is None:
+        return TYPE_EFFECT_PAIR[atk, def1, def2]
+    return effectiveness_vs_batch(atk, def1, def2, np.asarray(ability_ids, dtype=np.intp)[None, :])
+
+
 # =============================================================================
 # Strategic Item Categories
 # =============================================================================
 
 # Choice items that lock you into one move
-CHOICE_ITEMS = {'choiceband', 'choicespecs', 'choicescarf'}
+CHOICE_ITEMS = frozenset({'choiceband', 'choicespecs', 'choicescarf'})
 
 # Items that boost damage
 DAMAGE_BOOST_ITEMS = {
@@ -380,35 +679,105 @@ SPEED_ITEMS = {
 }
 
 # Healing items
-HEALING_ITEMS = {
+HEALING_ITEMS = frozenset({
     'leftovers', 'blacksludge', 'sitrusberry', 'aguavberry', 
     'figyberry', 'iapapaberry', 'magoberry', 'wikiberry', 'shellbell'
-}
+})
 
 # Status immunity items
-STATUS_IMMUNITY_ITEMS = {
+STATUS_IMMUNITY_ITEMS = frozenset({
     'lumberry', 'chestoberry', 'pechaberry', 'rawstberry', 
     'cheriberry', 'aspearberry', 'persimberry', 'safetygoggles'
-}
+})
 
 # Contact punishment
-CONTACT_PUNISH_ITEMS = {'rockyhelmet', 'stickybarb'}
+CONTACT_PUNISH_ITEMS = frozenset({'rockyhelmet', 'stickybarb'})
 
 # Type immunity items
-TYPE_IMMUNITY_ITEMS = {'airballoon'}
+TYPE_IMMUNITY_ITEMS = frozenset({'airballoon'})
 
 # Bulk items
-BULK_ITEMS = {'assaultvest', 'eviolite'}
+BULK_ITEMS = frozenset({'assaultvest', 'eviolite'})
 
 # Survival items (One-time protection)
-SURVIVAL_ITEMS = {'focussash', 'focusband'} 
+SURVIVAL_ITEMS = frozenset({'focussash', 'focusband'})
+
+
+# Bit positions of the item flags (same order as get_item_flags)
+ITEM_CHOICE_BIT = 1 << 0
+ITEM_DAMAGE_BOOST_BIT = 1 << 1
+ITEM_SPEED_BIT = 1 << 2
+ITEM_HEALING_BIT = 1 << 3
+ITEM_SURVIVAL_BIT = 1 << 4
+ITEM_BULK_BIT = 1 << 5
+ITEM_CONTACT_PUNISH_BIT = 1 << 6
+ITEM_STATUS_IMMUNITY_BIT = 1 << 7
+ITEM_TYPE_IMMUNITY_BIT = 1 << 8
+ITEM_KNOWN_BIT = 1 << 9
+NUM_ITEM_FLAGS = 10
+
+
+def _compute_item_bits(item_lower: str) -> int:
+    """Evaluate the flag membership tests for one normalized item."""
+    bits = ITEM_KNOWN_BIT
+    if item_lower in CHOICE_ITEMS:
+        bits |= ITEM_CHOICE_BIT
+    # Choice items are also damage boosters usually; we include lifeorb,
+    # expertbelt, and existing damage lists
+    if item_lower in DAMAGE_BOOST_ITEMS or item_lower in {'lifeorb', 'expertbelt'}:
+        bits |= ITEM_DAMAGE_BOOST_BIT
+    if item_lower in SPEED_ITEMS:
+        bits |= ITEM_SPEED_BIT
+    if item_lower in HEALING_ITEMS:
+        bits |= ITEM_HEALING_BIT
+    if item_lower in SURVIVAL_ITEMS:
+        bits |= ITEM_SURVIVAL_BIT
+    if item_lower in BULK_ITEMS:
+        bits |= ITEM_BULK_BIT
+    if item_lower in CONTACT_PUNISH_ITEMS:
+        bits |= ITEM_CONTACT_PUNISH_BIT
+    if item_lower in STATUS_IMMUNITY_ITEMS:
+        bits |= ITEM_STATUS_IMMUNITY_BIT
+    if item_lower in TYPE_IMMUNITY_ITEMS:
+        bits |= ITEM_TYPE_IMMUNITY_BIT
+    return bits
+
+
+# Every item this module knows about, with one precomputed flag bitmask each.
+# Two extra entries follow: an unlisted item (only is_known set) and no item.
+_ITEM_VOCAB = sorted(
+    CHOICE_ITEMS | set(DAMAGE_BOOST_ITEMS) | set(SPEED_ITEMS) | HEALING_ITEMS
+    | SURVIVAL_ITEMS | BULK_ITEMS | CONTACT_PUNISH_ITEMS | STATUS_IMMUNITY_ITEMS
+    | TYPE_IMMUNITY_ITEMS | {'lifeorb', 'expertbelt'}
+)
+_ITEM_ID: Dict[str, int] = {it: i for i, it in enumerate(_ITEM_VOCAB)}
+_UNKNOWN_ITEM_ROW = len(_ITEM_VOCAB)
+_NO_ITEM_ROW = _UNKNOWN_ITEM_ROW + 1
+_ITEM_FLAG_BITS = np.array(
+    [_compute_item_bits(it) for it in _ITEM_VOCAB] + [ITEM_KNOWN_BIT, 0],
+    dtype=np.uint16,
+)
+_ITEM_FLAG_BITS.flags.writeable = False
+
+# Expands a bitmask into the float32 flag vector used by the observation
+_ITEM_BITS_TO_FLAGS = (
+    (np.arange(1 << NUM_ITEM_FLAGS)[:, None] >> np.arange(NUM_ITEM_FLAGS)) & 1
+).astype(np.float32)
+_ITEM_BITS_TO_FLAGS.flags.writeable = False
+
+
+def get_item_bits(item: Optional[str]) -> int:
+    """Get the item flags as a bitmask of the ITEM_*_BIT constants."""
+    if not item:
+        return 0
+    return int(_ITEM_FLAG_BITS[_ITEM_ID.get(_norm(item), _UNKNOWN_ITEM_ROW)])
 
 
 def get_item_flags(item: Optional[str]) -> np.ndarray:
     """
     Get strategic flags for an item.
     
-    Returns 10 flags:
+    Returns 10 flags (read-only, copy before mutating):
     1. is_choice (1): Locks moves (Choice Band/Specs/Scarf)
     2. is_damage_boost (1): Boosts damage (Life Orb/Band/Specs/Belt/Plates)
     3. is_speed_boost (1): Boosts speed (Scarf)
@@ -420,52 +789,14 @@ def get_item_flags(item: Optional[str]) -> np.ndarray:
     9. is_type_immune (1): Grants immunity (Balloon)
     10. is_known (1): Item is known
     """
-    flags = np.zeros(10, dtype=np.float32)
-    
-    if not item:
-        return flags
-    
-    item_lower = item.lower().replace(' ', '').replace('-', '')
-    
-    # 1. Choice Lock
-    flags[0] = 1.0 if item_lower in CHOICE_ITEMS else 0.0
-    
-    # 2. Damage Boost (Choice items are also damage boosters usually)
-    # We include lifeorb, expertbelt, and existing damage lists
-    flags[1] = 1.0 if (item_lower in DAMAGE_BOOST_ITEMS or item_lower in {'lifeorb', 'expertbelt'}) else 0.0
-    
-    # 3. Speed Boost
-    flags[2] = 1.0 if item_lower in SPEED_ITEMS else 0.0
-    
-    # 4. Healing
-    flags[3] = 1.0 if item_lower in HEALING_ITEMS else 0.0
-    
-    # 5. Survival (Sash)
-    flags[4] = 1.0 if item_lower in SURVIVAL_ITEMS else 0.0
-    
-    # 6. Bulk (Vest)
-    flags[5] = 1.0 if item_lower in BULK_ITEMS else 0.0
-    
-    # 7. Punish (Helmet)
-    flags[6] = 1.0 if item_lower in CONTACT_PUNISH_ITEMS else 0.0
-    
-    # 8. Status Immunity (Lum)
-    flags[7] = 1.0 if item_lower in STATUS_IMMUNITY_ITEMS else 0.0
-    
-    # 9. Type Immunity (Balloon)
-    flags[8] = 1.0 if item_lower in TYPE_IMMUNITY_ITEMS else 0.0
-    
-    # 10. Is Known
-    flags[9] = 1.0
-    
-    return flags
+    return _ITEM_BITS_TO_FLAGS[get_item_bits(item)]
 
 
 def is_choice_item(item: Optional[str]) -> bool:
     """Check if item is a Choice item that locks into one move."""
     if not item:
         return False
-    return item.lower().replace(' ', '').replace('-', '') in CHOICE_ITEMS
+    return _norm(item) in CHOICE_ITEMS
 
 
 # =============================================================================
@@ -537,48 +868,92 @@ class MoveClassifier:
         'glare', 'stunspore', 'poisonpowder'
     })
     
+    # Category bits of the packed per-move flags (see move_bits)
+    BOOST_BIT = 1 << 0
+    RECOVERY_BIT = 1 << 1
+    HAZARD_BIT = 1 << 2
+    HAZARD_REMOVAL_BIT = 1 << 3
+    PRIORITY_BIT = 1 << 4
+    PROTECT_BIT = 1 << 5
+    PIVOT_BIT = 1 << 6
+    STATUS_BIT = 1 << 7
+    
     @classmethod
     def normalize(cls, move_id: str) -> str:
         """Normalize move ID for comparison."""
-        return move_id.lower().replace(' ', '').replace('-', '').replace("'", '')
+        return _norm(move_id)
+    
+    @classmethod
+    def move_bits(cls, move_id: str) -> int:
+        """Get all category flags of a move as a bitmask of the *_BIT constants."""
+        return _MOVE_BITS.get(_norm(move_id), 0)
     
     @classmethod
     def is_boost(cls, move_id: str) -> bool:
         """Check if move is a stat-boosting move."""
-        return cls.normalize(move_id) in cls.BOOST_MOVES
+        return bool(cls.move_bits(move_id) & cls.BOOST_BIT)
     
     @classmethod
     def is_recovery(cls, move_id: str) -> bool:
         """Check if move is a recovery/healing move."""
-        return cls.normalize(move_id) in cls.RECOVERY_MOVES
+        return bool(cls.move_bits(move_id) & cls.RECOVERY_BIT)
     
     @classmethod
     def is_hazard(cls, move_id: str) -> bool:
         """Check if move sets entry hazards."""
-        return cls.normalize(move_id) in cls.HAZARD_MOVES
+        return bool(cls.move_bits(move_id) & cls.HAZARD_BIT)
     
     @classmethod
     def is_hazard_removal(cls, move_id: str) -> bool:
         """Check if move removes hazards."""
-        return cls.normalize(move_id) in cls.HAZARD_REMOVAL
+        return bool(cls.move_bits(move_id) & cls.HAZARD_REMOVAL_BIT)
     
     @classmethod
     def is_priority(cls, move_id: str) -> bool:
         """Check if move has positive priority."""
-        return cls.normalize(move_id) in cls.PRIORITY_MOVES
+        return bool(cls.move_bits(move_id) & cls.PRIORITY_BIT)
     
     @classmethod
     def is_protect(cls, move_id: str) -> bool:
         """Check if move is a protect variant."""
-        return cls.normalize(move_id) in cls.PROTECT_MOVES
+        return bool(cls.move_bits(move_id) & cls.PROTECT_BIT)
     
     @classmethod
     def is_pivot(cls, move_id: str) -> bool:
         """Check if move is a pivoting move."""
-        return cls.normalize(move_id) in cls.PIVOT_MOVES
+        return bool(cls.move_bits(move_id) & cls.PIVOT_BIT)
     
     @classmethod
     def is_status_inflicting(cls, move_id: str) -> bool:
         """Check if move inflicts status."""
-        return cls.normalize(move_id) in cls.STATUS_INFLICTING
-
+        return bool(cls.move_bits(move_id) & cls.STATUS_BIT)
+
+
+# Packed category flags for every classified move, keyed by normalized ID
+_MOVE_BITS: Dict[str, int] = {}
+for _moves, _bit in (
+    (MoveClassifier.BOOST_MOVES, MoveClassifier.BOOST_BIT),
+    (MoveClassifier.RECOVERY_MOVES, MoveClassifier.RECOVERY_BIT),
+    (MoveClassifier.HAZARD_MOVES, MoveClassifier.HAZARD_BIT),
+    (MoveClassifier.HAZARD_REMOVAL, MoveClassifier.HAZARD_REMOVAL_BIT),
+    (MoveClassifier.PRIORITY_MOVES, MoveClassifier.PRIORITY_BIT),
+    (MoveClassifier.PROTECT_MOVES, MoveClassifier.PROTECT_BIT),
+    (MoveClassifier.PIVOT_MOVES, MoveClassifier.PIVOT_BIT),
+    (MoveClassifier.STATUS_INFLICTING, MoveClassifier.STATUS_BIT),
+):
+    for _move in _moves:
+        _MOVE_BITS[_move] = _MOVE_BITS.get(_move, 0) | _bit
+del _moves, _bit, _move
+
+
+def classify_moves(move_ids: Sequence[str]) -> np.ndarray:
+    """
+    Packed MoveClassifier category bits for several moves at once.
+    
+    Returns a uint16 array aligned with move_ids, so per-slot checks can be
+    done branchlessly, e.g. ``(classify_moves(ids) & MoveClassifier.PROTECT_BIT) != 0``.
+    """
+    return np.fromiter(
+        (_MOVE_BITS.get(_norm(m), 0) for m in move_ids),
+        dtype=np.uint16, count=len(move_ids),
+    )